@@ -1,96 +1,168 @@
 #!/usr/bin/env python3
 """
 Test script to verify parsing logic before running the full update script.
+
+The module is fully annotated so it can be compiled with mypyc
+(``mypyc test_parsing.py``); the plain .py stays as the fallback. It is
+pure Python + re, so it also runs well under PyPy (``pypy3 test_parsing.py``).
 """
 
-import re
+from __future__ import annotations
+
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, final
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
-def parse_date(date_str: str):
-    """Parse date from schedule file."""
-    formats = ['%b %d, %Y']  # Oct 1, 2025
-    for fmt in formats:
+def _regex_backend() -> Any:
+    """Pick the regex module; imported by name so mypy/mypyc see one Any-typed binding."""
+    if sys.implementation.name == 'pypy':
+        # PyPy's JIT handles stdlib re well; C extensions are slow there
+        return importlib.import_module('re')
+    # Optional linear-time DFA engine (pip install google-re2), then the
+    # third-party engine with better worst-case backtracking (pip install regex)
+    for name in ('re2', 'regex'):
         try:
-            return datetime.strptime(date_str.strip(), fmt)
-        except ValueError:
+            return importlib.import_module(name)
+        except ImportError:
             continue
-    return None
+    return importlib.import_module('re')
 
-def extract_game_info(line: str):
-    """Extract game information from a schedule line."""
-    line = line.strip()
-    
-    if not line or '(W ' in line or '(L ' in line:
+_re: Any = _regex_backend()
+
+@final
+class GameInfo(NamedTuple):
+    """Game information parsed from a schedule line."""
+    date: datetime
+    opponent: str
+    is_home: bool  # True for "vs", False for "@"
+    existing_time: Optional[str]
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# Completed games carry a result marker such as "(W 85-80)" or "(L 72-90)"
+_PLAYED_RE = _re.compile(r'\([WL] ')
+
+# Opponent runs up to the venue "@", the time "," or the end of the line;
+# the group starts and ends on a non-space so it needs no strip()
+_OPPONENT_RE = _re.compile(r'\s*([^@,\s](?:[^@,]*[^@,\s])?)\s*(?:@|,|$)')
+
+# Existing "H:MM [AM|PM] ET" time, wherever it sits after the opponent
+# (before or after the venue, with or without notes); same rule as
+# update_tipoff_times.py. Flag is inline for google-re2.
+_TIME_RE = _re.compile(r'(?i:\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET)')
+
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> Optional[datetime]:
+    """Parse date from schedule file."""
+    # Fixed "Oct 1, 2025" layout, so skip strptime's format machinery
+    try:
+        month, rest = date_str.strip().split(' ', 1)
+        day, year = rest.split(', ')
+        return datetime(int(year), _MONTHS[month], int(day))
+    except (KeyError, ValueError):
         return None
+
+def extract_game_info(line: str, *, stripped: bool = False) -> Optional[GameInfo]:
+    """Extract game information from a schedule line.
+
+    Pass ``stripped=True`` when the caller has already trimmed the line
+    (e.g. lines from ``str.splitlines()``) to skip the extra copy.
+    """
+    if not stripped:
+        line = line.strip()
     
-    # Extract date
-    date_match = re.search(r'([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})', line)
-    if not date_match:
+    if not line or _PLAYED_RE.search(line):
         return None
     
-    date = parse_date(date_match.group(1))
+    # Lines look like "<Mon> <d>, <YYYY> - <vs|@> <opponent>..."
+    head, _, rest = line.partition(' - ')
+    date = parse_date(head.rstrip())
     if not date:
         return None
     
-    # Extract home/away and opponent
-    is_home = 'vs ' in line
-    is_away = '@ ' in line and not line.startswith('@')
-    
-    if is_home:
-        opp_match = re.search(r'vs\s+([^@]+?)(?:@|,|$)', line)
-    elif is_away:
-        opp_match = re.search(r'@\s+([^@]+?)(?:@|,|$)', line)
+    # Home/away marker directly follows the date separator; "vs" in any case
+    if rest[:3].lower() == 'vs ':
+        is_home = True
+    elif rest.startswith('@ '):
+        is_home = False
     else:
         return None
     
-    if not opp_match:
+    match = _OPPONENT_RE.match(rest, 3 if is_home else 2)
+    if not match:
         return None
     
-    opponent = opp_match.group(1).strip()
+    opponent = match.group(1)
     
-    # Extract existing time if present
-    time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET)', line, re.IGNORECASE)
-    existing_time = time_match.group(1) if time_match else None
+    time_match = _TIME_RE.search(rest, match.end(1))
+    existing_time = time_match.group(0) if time_match else None
     
-    return {
-        'date': date,
-        'opponent': opponent,
-        'is_home': is_home,
-        'existing_time': existing_time,
-        'line': line
-    }
-
-# Test with a few lines from the schedule files
-test_lines = [
-    "Nov 13, 2025 - vs Valencia Basket @ Halle Georges Carpentier Arena, 2:45 PM ET",
-    "Nov 12, 2025 - @ AX Armani Exchange Milan @ Mediolanum Forum, 2:30 PM ET",
-    "Oct 1, 2025 - vs Valencia Basket @ Astroballe",
-    "Nov 19, 2025 - vs AS Monaco Basket @ Astroballe, 2:00 PM ET",
-]
-
-print("Testing parsing logic:")
-print("=" * 60)
-
-for line in test_lines:
-    game = extract_game_info(line)
-    if game:
-        print(f"\nLine: {line}")
-        print(f"  Date: {game['date'].strftime('%b %d, %Y')}")
-        print(f"  Opponent: {game['opponent']}")
-        print(f"  Home: {game['is_home']}")
-        print(f"  Existing time: {game['existing_time']}")
-    else:
-        print(f"\nLine: {line}")
-        print(f"  Could not parse")
+    return GameInfo(date, opponent, is_home, existing_time)
+
+def parse_schedule_text(text: str) -> List[GameInfo]:
+    """Extract every upcoming game from a whole schedule file.
+
+    Convenience wrapper that runs ``extract_game_info`` on each line, so it
+    applies exactly the per-line rules; it is not a faster bulk parser.
+    """
+    games = []
+    for line in text.splitlines():
+        game = extract_game_info(line)
+        if game:
+            games.append(game)
+    return games
 
-print("\n" + "=" * 60)
-print("Parsing test complete!")
+def parse_schedule_file(path: Path) -> List[GameInfo]:
+    """Extract every upcoming game from a schedule file on disk."""
+    return parse_schedule_text(path.read_text(encoding='utf-8'))
 
+def _main() -> None:
+    """Run the parser over schedule files given as arguments, or sample lines."""
+    # Collect all output and emit it with a single write at the end
+    out = []
+    paths = [Path(arg) for arg in sys.argv[1:]]
+    if paths:
+        # Files are independent, so parse them on separate cores
+        with ProcessPoolExecutor() as executor:
+            for path, games in zip(paths, executor.map(parse_schedule_file, paths)):
+                out.append(f"{path.name}: {len(games)} upcoming games")
+        sys.stdout.write("\n".join(out) + "\n")
+        return
 
+    test_lines = [
+        "Nov 13, 2025 - vs Valencia Basket @ Halle Georges Carpentier Arena, 2:45 PM ET",
+        "Nov 12, 2025 - @ AX Armani Exchange Milan @ Mediolanum Forum, 2:30 PM ET",
+        "Oct 1, 2025 - vs Valencia Basket @ Astroballe",
+        "Nov 19, 2025 - vs AS Monaco Basket @ Astroballe, 2:00 PM ET",
+    ]
 
+    out.append("Testing parsing logic:")
+    out.append("=" * 60)
 
+    for line in test_lines:
+        game = extract_game_info(line)
+        if game:
+            out.append(
+                f"\nLine: {line}\n"
+                f"  Date: {game.date:%b %d, %Y}\n"
+                f"  Opponent: {game.opponent}\n"
+                f"  Home: {game.is_home}\n"
+                f"  Existing time: {game.existing_time}"
+            )
+        else:
+            out.append(f"\nLine: {line}\n  Could not parse")
 
+    out.append("\n" + "=" * 60)
+    out.append("Parsing test complete!")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
+if __name__ == "__main__":
+    _main()
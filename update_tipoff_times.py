@@ -4,26 +4,59 @@ Update tipoff times in schedule files by fetching from official sources.
 Only updates the time portion, preserving dates, opponents, and formatting.
 """
 
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
 import re
 import sys
-from datetime import datetime
+import time
+import traceback
+from datetime import datetime, tzinfo
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from urllib.parse import urlparse
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from dataclasses import dataclass, replace
 from zoneinfo import ZoneInfo
+import aiofiles
 import requests
-from bs4 import BeautifulSoup
-from fuzzywuzzy import fuzz
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+from rapidfuzz import fuzz
+from rapidfuzz.distance import JaroWinkler
 import json
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 
 try:
-    from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("[WARN] Playwright not available. Install with: pip install playwright && playwright install chromium")
 
+
+# Full tracebacks for fetch failures are only emitted with --debug
+logger = logging.getLogger(__name__)
+
+# Progress lines of the schedule file being processed. Each file's task
+# gets its own list, so concurrent files are written out as whole blocks
+# instead of interleaving line by line.
+_FILE_LOG: ContextVar[Optional[List[str]]] = ContextVar('_FILE_LOG', default=None)
+
+
+def log(message: str = '') -> None:
+    """Print a progress line, or buffer it for the current file's block."""
+    lines = _FILE_LOG.get()
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
 # Team mappings
 TEAM_CONFIG = {
     'adam_atamna_schedule.txt': {
@@ -64,6 +97,29 @@ TEAM_CONFIG = {
     },
 }
 
+
+class TeamRow(NamedTuple):
+    """The TEAM_CONFIG fields process_schedule_file reads, frozen per file."""
+    team_name: str
+    timezone: str
+    leagues: Tuple[str, ...]
+    realgm_url: str
+    euroleague_slug: str
+
+
+# Resolved once at import so per-file code unpacks a tuple instead of
+# re-reading (and defaulting) dict keys
+_TEAM_ROWS: Dict[str, TeamRow] = {
+    filename: TeamRow(
+        config['team_name'],
+        config['timezone'],
+        tuple(config['leagues']),
+        config.get('realgm_url', ''),
+        config.get('euroleague_slug', ''),
+    )
+    for filename, config in TEAM_CONFIG.items()
+}
+
 # League URLs
 EUROLEAGUE_BASE = 'https://www.euroleaguebasketball.net'
 EUROCUP_BASE = 'https://www.euroleaguebasketball.net/eurocup'
@@ -72,6 +128,49 @@ LNB_BASE = 'https://www.lnb.fr'
 
 ET_TIMEZONE = ZoneInfo('America/New_York')
 
+# Opponent acceptance (0-100 on normalized names): ratio >= 80, or
+# partial_ratio >= 85 with ratio still >= 75
+OPPONENT_RATIO_THRESHOLD = 80
+OPPONENT_PARTIAL_RATIO_THRESHOLD = 85
+OPPONENT_MIN_RATIO = 75
+
+# Precompiled patterns
+# Schedule file lines
+# Date, vs/@ marker and opponent (up to the venue "@", a comma or the end);
+# not anchored, since the venue, time and notes may follow in any order
+_LINE_RE = re.compile(
+    r'(?P<date>[A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})\s*-\s*(?P<ha>(?i:vs)|@)\s+'
+    r'(?P<opp>[^@,]+?)\s*(?:@|,|$)'
+)
+# Existing "H:MM [AM|PM] ET" time, anywhere in the line
+_GAME_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET', re.IGNORECASE)
+_EXISTING_TIME_RE = re.compile(r',\s*\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET', re.IGNORECASE)
+_TIME_SUFFIX_RE = re.compile(r'\s*(ET|CET|CEST|local).*$', re.IGNORECASE)
+
+# Official schedule pages
+_RGM_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+_CLOCK_RE = re.compile(r'(\d{1,2}):(\d{2})')
+_ACB_SPANISH_DATE_RE = re.compile(r'(\d{1,2})\s+(ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)', re.I)
+_ACB_DATE_OR_TIME_CELL_RE = re.compile(r'\d{1,2}[:/]\d')
+_ACB_TEAM_CELL_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+')
+_LNB_FRENCH_DATE_RE = re.compile(r'(\d{1,2})\s+(jan|fév|mar|avr|mai|jun|jui|aoû|sep|oct|nov|déc)', re.I)
+_LNB_TIME_RE = re.compile(r'(\d{1,2})[h:](\d{2})')
+_LNB_OPPONENT_RE = re.compile(r'(?:vs|contre|@)\s+([A-Z][^@\n]+?)(?:\s+@|\s+\(|\s*\d|$)', re.I)
+# Sponsor/club suffixes dropped from team names before matching
+_TEAM_NOISE_RE = re.compile(r'\s+(?:Basketball|Basket|Beko|FOX|SAD|AX|KK|CB)(?=\s|$)', re.I)
+
+# Precompiled XPath queries (EXSLT regex for case-insensitive class matching)
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+_ROW_CELLS = etree.XPath('.//td | .//th')
+_ACB_SCHEDULE_TABLES = etree.XPath(
+    "//table[re:test(@class, 'schedule|calendario|partido', 'i')]", namespaces=_XPATH_NS
+)
+_LNB_SCHEDULE_ELEMENTS = etree.XPath(
+    "//*[self::tr or self::div or self::article][re:test(@class, 'match|game|rencontre', 'i')]",
+    namespaces=_XPATH_NS,
+)
+
 # Common headers for requests
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -79,6 +178,53 @@ HEADERS = {
     'Accept-Language': 'en-US,en;q=0.5',
 }
 
+# Shared session so keep-alive connections are reused across fetches
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Per-host politeness delay: requests to different sites go out back to
+# back, repeated hits on one host are spaced at least min_gap seconds apart
+_LAST_HIT: Dict[str, float] = {}
+
+
+async def throttle(url: str, min_gap: float = 1.0) -> None:
+    """Wait until url's host has not been hit for min_gap seconds."""
+    host = urlparse(url).netloc
+    # Reserve the next slot before awaiting so concurrent workers queue up;
+    # everything runs on the event loop thread, so no lock is needed
+    now = time.monotonic()
+    slot = max(now, _LAST_HIT.get(host, 0.0) + min_gap)
+    _LAST_HIT[host] = slot
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+# Lean headless Chromium for containers/CI: less RAM, faster startup
+CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-extensions',
+    '--mute-audio',
+]
+
+
+def chromium_launch_args(no_sandbox: bool = False) -> List[str]:
+    """Chromium flags; the sandbox is only disabled on request or when running as root.
+    
+    Root (as in most containers) can't start Chromium's sandbox at all; on a
+    normal user account it stays on, since the pages run third-party JS.
+    """
+    if no_sandbox or (hasattr(os, 'geteuid') and os.geteuid() == 0):
+        return CHROMIUM_ARGS + ['--no-sandbox']
+    return CHROMIUM_ARGS
+
 
 @dataclass
 class Game:
@@ -104,6 +250,12 @@ class OfficialGame:
 
 def parse_date(date_str: str) -> Optional[datetime]:
     """Parse various date formats from schedule files."""
+    # Strip before the cached lookup so padded variants share one entry
+    return _parse_date(date_str.strip())
+
+
+@lru_cache(maxsize=2048)
+def _parse_date(date_str: str) -> Optional[datetime]:
     formats = [
         '%b %d, %Y',  # Oct 1, 2025
         '%Y-%m-%d',   # 2025-10-01
@@ -112,7 +264,7 @@ def parse_date(date_str: str) -> Optional[datetime]:
     
     for fmt in formats:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
     
@@ -121,8 +273,13 @@ def parse_date(date_str: str) -> Optional[datetime]:
 
 def parse_time(time_str: str) -> Optional[datetime.time]:
     """Parse time string in various formats."""
+    return _parse_time(time_str.strip())
+
+
+@lru_cache(maxsize=2048)
+def _parse_time(time_str: str) -> Optional[datetime.time]:
     # Remove common suffixes
-    time_str = re.sub(r'\s*(ET|CET|CEST|local).*$', '', time_str, flags=re.IGNORECASE)
+    time_str = _TIME_SUFFIX_RE.sub('', time_str)
     time_str = time_str.strip()
     
     formats = [
@@ -151,149 +308,183 @@ def extract_game_info(line: str, league: str) -> Optional[Game]:
     # Match patterns like:
     # "Oct 1, 2025 - vs Valencia Basket @ Astroballe"
     # "Nov 13, 2025 - vs Valencia Basket @ Halle Georges Carpentier Arena, 2:45 PM ET"
-    
-    # Try to extract date
-    date_match = re.search(r'([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})', line)
-    if not date_match:
+    # "Nov 13, 2025 - vs Valencia Basket , 2:45 PM ET @ Halle Georges Carpentier Arena"
+    match = _LINE_RE.search(line)
+    if not match:
         return None
     
-    date_str = date_match.group(1)
-    date = parse_date(date_str)
+    date = parse_date(match.group('date'))
     if not date:
         return None
     
-    # Extract home/away and opponent
-    is_home = 'vs ' in line or ' vs ' in line
-    is_away = '@ ' in line and not line.strip().startswith('@')
-    
-    if not (is_home or is_away):
-        return None
-    
-    # Extract opponent name (between "vs"/"@" and "@" or end of line or comma)
-    if is_home:
-        opp_match = re.search(r'vs\s+([^@]+?)(?:@|,|$)', line)
-    else:
-        # For away games, opponent comes after the first @
-        opp_match = re.search(r'@\s+([^@]+?)(?:@|,|$)', line)
-    
-    if not opp_match:
-        return None
-    
-    opponent = opp_match.group(1).strip()
-    
-    # Extract existing time if present
-    time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET)', line, re.IGNORECASE)
-    existing_time = time_match.group(1) if time_match else None
+    time_match = _GAME_TIME_RE.search(line, match.end('opp'))
     
     return Game(
         original_line=line,
         date=date,
-        opponent=opponent,
-        is_home=is_home,
+        opponent=match.group('opp').strip(),
+        is_home=match.group('ha') != '@',
         league=league,
-        existing_time=existing_time
+        existing_time=time_match.group(0) if time_match else None
     )
 
 
+@lru_cache(maxsize=1024)
 def normalize_team_name(name: str) -> str:
     """Normalize team name for matching."""
-    # Remove common suffixes and normalize
-    name = name.replace(' Basket', '').replace(' Basketball', '').replace(' Beko', '')
-    name = name.replace(' FOX', '').replace(' SAD', '').replace(' Basket', '')
-    name = name.replace(' AX Armani Exchange', ' Armani').replace(' AX', '')
-    name = name.replace(' KK ', '').replace(' CB ', '')
-    name = name.strip()
-    return name.lower()
+    # Remove common suffixes and normalize in a single regex pass
+    name = name.replace(' AX Armani Exchange', ' Armani')
+    return _TEAM_NOISE_RE.sub('', name).strip().lower()
+
+
+def element_text(elem, separator: str = '') -> str:
+    """Stripped text of an lxml element, joined like BeautifulSoup's get_text(strip=True)."""
+    return separator.join(chunk.strip() for chunk in elem.itertext() if chunk.strip())
 
 
-def fuzzy_match_teams(name1: str, name2: str, threshold: int = 80) -> bool:
-    """Check if two team names match using fuzzy matching."""
-    norm1 = normalize_team_name(name1)
-    norm2 = normalize_team_name(name2)
+def parse_realgm_table(table, league: str) -> List[OfficialGame]:
+    """Extract games from one RealGM schedule table element."""
+    games = []
     
-    # Exact match after normalization
-    if norm1 == norm2:
-        return True
+    rows = table.xpath('.//tr')
+    for row in rows[1:]:  # Skip header
+        cells = _ROW_CELLS(row)
+        if len(cells) < 4:
+            continue
+        
+        # Try to extract date, time, opponent
+        date_text = element_text(cells[0])
+        time_text = element_text(cells[1])
+        opp_text = element_text(cells[2])
+        hoa_text = ''.join(row.itertext())
+        
+        # Parse date (RealGM format varies)
+        date_match = _RGM_DATE_RE.search(date_text)
+        if not date_match:
+            continue
+        
+        month, day, year = date_match.groups()
+        try:
+            game_date = datetime(int(year), int(month), int(day))
+        except ValueError:
+            continue
+        
+        # Parse time
+        time_obj = parse_time(time_text)
+        if not time_obj:
+            continue
+        
+        # Combine date and time
+        local_dt = datetime.combine(game_date.date(), time_obj)
+        
+        # Determine home/away
+        is_home = 'vs' in hoa_text.lower() or 'home' in hoa_text.lower()
+        
+        # Normalize opponent name
+        opponent = opp_text.strip()
+        
+        games.append(OfficialGame(
+            date=game_date,
+            opponent=opponent,
+            is_home=is_home,
+            local_time=local_dt,
+            league=league
+        ))
     
-    # Fuzzy match
-    ratio = fuzz.ratio(norm1, norm2)
-    partial_ratio = fuzz.partial_ratio(norm1, norm2)
+    return games
+
+
+def read_realgm_events(parser, league: str, games: List[OfficialGame]) -> bool:
+    """Parse every table the pull parser has finished; True once games were found."""
+    for _, table in parser.read_events():
+        games.extend(parse_realgm_table(table, league))
+        table.clear()  # Drop the parsed rows, only games are kept
+    return bool(games)
+
+
+def download_realgm_games(realgm_url: str, league: str) -> List[OfficialGame]:
+    """Download and parse a RealGM schedule page (blocking, run in a worker thread)."""
+    games = []
+    
+    # Stream the page and parse each table as soon as it closes. The
+    # schedule is a single table, so stop downloading once it yields games.
+    with SESSION.get(realgm_url, stream=True, timeout=15) as response:
+        response.raise_for_status()
+        
+        parser = etree.HTMLPullParser(events=('end',), tag='table')
+        for chunk in response.iter_content(chunk_size=65536):
+            parser.feed(chunk)
+            if read_realgm_events(parser, league, games):
+                break
+        else:
+            parser.close()
+            read_realgm_events(parser, league, games)
     
-    return ratio >= threshold or partial_ratio >= 85
+    return games
+
 
+# RealGM rows downloaded this run, by URL. One team page is the fallback for
+# each of the team's leagues, so it is parsed once and re-tagged per league.
+_REALGM_GAMES: Dict[str, List[OfficialGame]] = {}
 
-def fetch_realgm_schedule(realgm_url: str, team_tz: str, team_name: str, league: str) -> List[OfficialGame]:
+
+async def fetch_realgm_schedule(realgm_url: str, team_tz: str, team_name: str, league: str) -> List[OfficialGame]:
     """Fetch schedule from RealGM (fallback aggregator)."""
     games = []
     
     if not realgm_url:
         return games
     
+    cached = _REALGM_GAMES.get(realgm_url)
+    if cached is not None:
+        return [replace(game, league=league) for game in cached]
+    
     try:
-        response = requests.get(realgm_url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # RealGM typically uses tables for schedules
-        # Look for schedule table
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows[1:]:  # Skip header
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 4:
-                    continue
-                
-                # Try to extract date, time, opponent
-                date_text = cells[0].get_text(strip=True) if len(cells) > 0 else ''
-                time_text = cells[1].get_text(strip=True) if len(cells) > 1 else ''
-                opp_text = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                hoa_text = row.get_text()
-                
-                # Parse date (RealGM format varies)
-                date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', date_text)
-                if not date_match:
-                    continue
-                
-                month, day, year = date_match.groups()
-                try:
-                    game_date = datetime(int(year), int(month), int(day))
-                except ValueError:
-                    continue
-                
-                # Parse time
-                time_obj = parse_time(time_text)
-                if not time_obj:
-                    continue
-                
-                # Combine date and time
-                local_dt = datetime.combine(game_date.date(), time_obj)
-                
-                # Determine home/away
-                is_home = 'vs' in hoa_text.lower() or 'home' in hoa_text.lower()
-                
-                # Normalize opponent name
-                opponent = opp_text.strip()
-                
-                games.append(OfficialGame(
-                    date=game_date,
-                    opponent=opponent,
-                    is_home=is_home,
-                    local_time=local_dt,
-                    league=league
-                ))
+        await throttle(realgm_url)
+        games = await asyncio.to_thread(download_realgm_games, realgm_url, league)
+        _REALGM_GAMES[realgm_url] = games
         
         if games:
-            print(f"  [INFO] Found {len(games)} games from RealGM")
+            log(f"  [INFO] Found {len(games)} games from RealGM")
         
     except Exception as e:
-        print(f"  [WARN] Failed to fetch RealGM schedule: {e}")
+        log(f"  [WARN] Failed to fetch RealGM schedule: {e}")
     
     return games
 
 
-def fetch_euroleague_schedule_playwright(page: Page, team_slug: str, team_tz: str, team_name: str) -> List[OfficialGame]:
+async def replace_page(page: Page) -> Page:
+    """Swap a closed, crashed or failed tab for a fresh one in the same context."""
+    try:
+        if not page.is_closed():
+            await page.close()
+        return await page.context.new_page()
+    except Exception:
+        # Context is gone; hand the old tab back so later fetches fail fast
+        return page
+
+
+@asynccontextmanager
+async def borrowed_page(page_pool: asyncio.Queue):
+    """Take a warm tab from the pool and hand it back when done.
+    
+    A tab that was closed, or whose fetch raised (e.g. after a crash or
+    timeout), is replaced so one dead tab can't break later fetches.
+    """
+    page: Page = await page_pool.get()
+    failed = False
+    try:
+        yield page
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        if failed or page.is_closed():
+            page = await replace_page(page)
+        page_pool.put_nowait(page)
+
+
+async def fetch_euroleague_schedule_playwright(page_pool: asyncio.Queue, team_slug: str, team_tz: str, team_name: str) -> List[OfficialGame]:
     """Fetch EuroLeague schedule using Playwright."""
     games = []
     
@@ -302,36 +493,46 @@ def fetch_euroleague_schedule_playwright(page: Page, team_slug: str, team_tz: st
     
     try:
         url = f'{EUROLEAGUE_BASE}/euroleague/teams/{team_slug}/schedule'
-        page.goto(url, wait_until='load', timeout=60000)
-        page.wait_for_timeout(5000)  # Wait for JS to render
-        
-        # Try multiple selectors (based on TypeScript code)
-        selectors = [
-            'table tbody tr',
-            '.schedule-row',
-            '[data-game]',
-            '.game-card',
-            '.match-item',
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = page.query_selector_all(selector)
-                if elements:
-                    print(f"  [INFO] Found {len(elements)} elements with selector: {selector}")
-                    # Parse elements (implementation depends on actual HTML)
-                    # For now, return empty - needs site-specific parsing
-                    break
-            except:
-                continue
+        await throttle(url)
+        async with borrowed_page(page_pool) as page:
+            await page.goto(url, wait_until='load', timeout=60000)
+            await page.wait_for_timeout(5000)  # Wait for JS to render
+            
+            # Try multiple selectors (based on TypeScript code)
+            selectors = [
+                'table tbody tr',
+                '.schedule-row',
+                '[data-game]',
+                '.game-card',
+                '.match-item',
+            ]
+            
+            for selector in selectors:
+                try:
+                    elements = await page.query_selector_all(selector)
+                    if elements:
+                        log(f"  [INFO] Found {len(elements)} elements with selector: {selector}")
+                        # Parse elements (implementation depends on actual HTML)
+                        # For now, return empty - needs site-specific parsing
+                        break
+                except:
+                    continue
         
     except Exception as e:
-        print(f"  [WARN] Failed to fetch EuroLeague schedule with Playwright: {e}")
+        log(f"  [WARN] Failed to fetch EuroLeague schedule with Playwright: {e}")
     
     return games
 
 
-def fetch_acb_schedule_web(team_name: str, team_tz: str, playwright_page: Optional[Page] = None) -> List[OfficialGame]:
+async def render_page_html(page_pool: asyncio.Queue, url: str) -> str:
+    """Load a JS-rendered page in a pooled tab and return its HTML."""
+    async with borrowed_page(page_pool) as page:
+        await page.goto(url, wait_until='networkidle', timeout=30000)
+        await page.wait_for_timeout(3000)
+        return await page.content()
+
+
+async def fetch_acb_schedule_web(team_name: str, team_tz: str, page_pool: Optional[asyncio.Queue] = None) -> List[OfficialGame]:
     """Fetch Liga ACB schedule from web page."""
     games = []
     
@@ -343,55 +544,53 @@ def fetch_acb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
     
     team_id = ACB_TEAM_IDS.get(team_name)
     if not team_id:
-        print(f"  [WARN] No ACB team ID found for {team_name}")
+        log(f"  [WARN] No ACB team ID found for {team_name}")
         return games
     
     try:
         # Try team-specific schedule page
         url = f'{ACB_BASE}/club/calendario/id/{team_id}'
+        await throttle(url)
         
-        if playwright_page:
-            print(f"  [INFO] Fetching ACB schedule with Playwright: {url}")
-            playwright_page.goto(url, wait_until='networkidle', timeout=30000)
-            playwright_page.wait_for_timeout(3000)
-            html = playwright_page.content()
-            soup = BeautifulSoup(html, 'lxml')
+        if page_pool is not None:
+            log(f"  [INFO] Fetching ACB schedule with Playwright: {url}")
+            doc = lxml_html.fromstring(await render_page_html(page_pool, url))
         else:
-            print(f"  [INFO] Fetching ACB schedule with requests: {url}")
-            response = requests.get(url, headers=HEADERS, timeout=15)
+            log(f"  [INFO] Fetching ACB schedule with requests: {url}")
+            response = await asyncio.to_thread(SESSION.get, url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            doc = lxml_html.fromstring(response.content)
         
-        print(f"  [DEBUG] Page title: {soup.title.string if soup.title else 'No title'}")
+        log(f"  [DEBUG] Page title: {doc.findtext('.//title') or 'No title'}")
         
         # Look for schedule table or game cards
         # Common patterns: table with schedule rows, or divs with game info
-        schedule_tables = soup.find_all('table', class_=re.compile(r'schedule|calendario|partido', re.I))
+        schedule_tables = _ACB_SCHEDULE_TABLES(doc)
         
         if not schedule_tables:
             # Try finding any table with multiple rows
-            all_tables = soup.find_all('table')
-            for table in all_tables:
-                rows = table.find_all('tr')
+            for table in doc.iter('table'):
+                rows = table.xpath('.//tr')
                 if len(rows) > 5:  # Likely a schedule table
                     schedule_tables = [table]
                     break
         
         for table in schedule_tables:
-            rows = table.find_all('tr')
+            rows = table.xpath('.//tr')
             for row in rows[1:]:  # Skip header
-                cells = row.find_all(['td', 'th'])
+                cells = _ROW_CELLS(row)
                 if len(cells) < 3:
                     continue
                 
                 # Extract date, time, opponent from cells
-                row_text = ' '.join([c.get_text(strip=True) for c in cells])
+                cell_texts = [element_text(c) for c in cells]
+                row_text = ' '.join(cell_texts)
                 
                 # Try to find date (various formats)
-                date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', row_text)
+                date_match = _NUMERIC_DATE_RE.search(row_text)
                 if not date_match:
                     # Try Spanish date format
-                    date_match = re.search(r'(\d{1,2})\s+(ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)', row_text, re.I)
+                    date_match = _ACB_SPANISH_DATE_RE.search(row_text)
                 
                 if not date_match:
                     continue
@@ -412,7 +611,7 @@ def fetch_acb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
                     continue
                 
                 # Extract time
-                time_match = re.search(r'(\d{1,2}):(\d{2})', row_text)
+                time_match = _CLOCK_RE.search(row_text)
                 if not time_match:
                     continue
                 
@@ -427,13 +626,12 @@ def fetch_acb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
                 
                 # Extract opponent (usually in a cell with team name)
                 opponent = ''
-                for cell in cells:
-                    cell_text = cell.get_text(strip=True)
+                for cell_text in cell_texts:
                     # Skip date/time cells
-                    if re.search(r'\d{1,2}[:/]\d', cell_text):
+                    if _ACB_DATE_OR_TIME_CELL_RE.search(cell_text):
                         continue
                     # Look for team-like text (capitalized, multiple words)
-                    if re.search(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+', cell_text):
+                    if _ACB_TEAM_CELL_RE.search(cell_text):
                         opponent = cell_text
                         break
                 
@@ -452,17 +650,16 @@ def fetch_acb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
                 ))
         
         if games:
-            print(f"  [INFO] Found {len(games)} ACB games")
+            log(f"  [INFO] Found {len(games)} ACB games")
         
     except Exception as e:
-        print(f"  [WARN] Failed to fetch ACB schedule: {e}")
-        import traceback
-        traceback.print_exc()
+        log(f"  [WARN] Failed to fetch ACB schedule: {e}")
+        logger.debug("ACB fetch failed", exc_info=True)
     
     return games
 
 
-def fetch_lnb_schedule_web(team_name: str, team_tz: str, playwright_page: Optional[Page] = None) -> List[OfficialGame]:
+async def fetch_lnb_schedule_web(team_name: str, team_tz: str, page_pool: Optional[asyncio.Queue] = None) -> List[OfficialGame]:
     """Fetch LNB Pro A schedule from web page."""
     games = []
     
@@ -474,47 +671,40 @@ def fetch_lnb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
     
     team_slug = LNB_TEAM_SLUGS.get(team_name)
     if not team_slug:
-        print(f"  [WARN] No LNB team slug found for {team_name}")
+        log(f"  [WARN] No LNB team slug found for {team_name}")
         return games
     
     try:
         # Try team-specific schedule page
         url = f'{LNB_BASE}/fr/equipe/{team_slug}/calendrier'
+        await throttle(url)
         
-        if playwright_page:
-            playwright_page.goto(url, wait_until='networkidle', timeout=30000)
-            playwright_page.wait_for_timeout(3000)
-            html = playwright_page.content()
-            soup = BeautifulSoup(html, 'lxml')
+        if page_pool is not None:
+            doc = lxml_html.fromstring(await render_page_html(page_pool, url))
         else:
-            response = requests.get(url, headers=HEADERS, timeout=15)
+            response = await asyncio.to_thread(SESSION.get, url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            doc = lxml_html.fromstring(response.content)
         
         # Look for schedule elements
         # Common patterns: table rows, divs with game/match classes
-        schedule_elements = (
-            soup.find_all('tr', class_=re.compile(r'match|game|rencontre', re.I)) +
-            soup.find_all('div', class_=re.compile(r'match|game|rencontre', re.I)) +
-            soup.find_all('article', class_=re.compile(r'match|game|rencontre', re.I))
-        )
+        schedule_elements = _LNB_SCHEDULE_ELEMENTS(doc)
         
         if not schedule_elements:
             # Fallback: look for any table
-            tables = soup.find_all('table')
-            for table in tables:
-                schedule_elements = table.find_all('tr')
+            for table in doc.iter('table'):
+                schedule_elements = table.xpath('.//tr')
                 if len(schedule_elements) > 5:
                     break
         
         for elem in schedule_elements:
-            elem_text = elem.get_text(separator=' ', strip=True)
+            elem_text = element_text(elem, ' ')
             
             # Extract date
-            date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', elem_text)
+            date_match = _NUMERIC_DATE_RE.search(elem_text)
             if not date_match:
                 # Try French date format
-                date_match = re.search(r'(\d{1,2})\s+(jan|fév|mar|avr|mai|jun|jui|aoû|sep|oct|nov|déc)', elem_text, re.I)
+                date_match = _LNB_FRENCH_DATE_RE.search(elem_text)
             
             if not date_match:
                 continue
@@ -533,9 +723,9 @@ def fetch_lnb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
                 continue
             
             # Extract time
-            time_match = re.search(r'(\d{1,2})[h:](\d{2})', elem_text)
+            time_match = _LNB_TIME_RE.search(elem_text)
             if not time_match:
-                time_match = re.search(r'(\d{1,2}):(\d{2})', elem_text)
+                time_match = _CLOCK_RE.search(elem_text)
             
             if not time_match:
                 continue
@@ -552,7 +742,7 @@ def fetch_lnb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
             # Extract opponent
             opponent = ''
             # Look for team name patterns
-            team_pattern = re.search(r'(?:vs|contre|@)\s+([A-Z][^@\n]+?)(?:\s+@|\s+\(|\s*\d|$)', elem_text, re.I)
+            team_pattern = _LNB_OPPONENT_RE.search(elem_text)
             if team_pattern:
                 opponent = team_pattern.group(1).strip()
             
@@ -571,74 +761,78 @@ def fetch_lnb_schedule_web(team_name: str, team_tz: str, playwright_page: Option
             ))
         
         if games:
-            print(f"  [INFO] Found {len(games)} LNB games")
+            log(f"  [INFO] Found {len(games)} LNB games")
         
     except Exception as e:
-        print(f"  [WARN] Failed to fetch LNB schedule: {e}")
-        import traceback
-        traceback.print_exc()
+        log(f"  [WARN] Failed to fetch LNB schedule: {e}")
+        logger.debug("LNB fetch failed", exc_info=True)
     
     return games
 
 
-def convert_to_et(local_time: datetime, local_tz: str) -> datetime:
-    """Convert local time to Eastern Time."""
-    local_zone = ZoneInfo(local_tz)
-    et_zone = ET_TIMEZONE
-    
-    # Localize the datetime
-    local_dt = local_time.replace(tzinfo=local_zone)
-    
-    # Convert to ET
-    et_dt = local_dt.astimezone(et_zone)
-    
-    return et_dt
+@lru_cache(maxsize=32)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Resolve a timezone name once; ZoneInfo construction reads tzdata."""
+    return ZoneInfo(name)
+
+
+def convert_to_et(local_time: datetime, local_tz: tzinfo) -> datetime:
+    """Convert local time to Eastern Time (resolve local_tz once with _zoneinfo)."""
+    return local_time.replace(tzinfo=local_tz).astimezone(ET_TIMEZONE)
 
 
 def format_time_et(dt: datetime) -> str:
-    """Format datetime as HH:MM AM/PM ET."""
-    time_str = dt.strftime('%I:%M %p ET')
-    # Remove leading zero from hour
-    if time_str.startswith('0'):
-        time_str = time_str[1:]
-    return time_str
+    """Format datetime as H:MM AM/PM ET (no leading zero on the hour)."""
+    hour = dt.hour % 12 or 12
+    am_pm = 'AM' if dt.hour < 12 else 'PM'
+    return f'{hour}:{dt.minute:02d} {am_pm} ET'
 
 
-def match_game(game: Game, official_games: List[OfficialGame]) -> Optional[OfficialGame]:
-    """Match a game from schedule file with official games."""
+def match_game(game: Game, candidates: Sequence[OfficialGame]) -> Optional[OfficialGame]:
+    """Match a game from schedule file with official games on the same
+    date, league and home/away side (see ``index_official_games``)."""
     best_match = None
-    best_score = 0
+    best_score = -1.0
+    game_norm = normalize_team_name(game.opponent)
     
-    for official in official_games:
-        # Date must match exactly (same day)
-        if game.date.date() != official.date.date():
-            continue
-        
-        # League must match
-        if game.league != official.league:
-            continue
-        
-        # Home/away must match
-        if game.is_home != official.is_home:
+    for official in candidates:
+        official_norm = normalize_team_name(official.opponent)
+        if not opponents_match(game_norm, official_norm):
             continue
         
-        # Opponent must match (fuzzy)
-        if fuzzy_match_teams(game.opponent, official.opponent):
-            # Prefer exact matches, but accept fuzzy matches
-            score = fuzz.ratio(normalize_team_name(game.opponent), 
-                             normalize_team_name(official.opponent))
-            if score > best_score:
-                best_score = score
-                best_match = official
+        # Rank accepted candidates by Jaro-Winkler similarity
+        score = JaroWinkler.normalized_similarity(game_norm, official_norm)
+        if score > best_score:
+            best_score = score
+            best_match = official
     
-    return best_match if best_score >= 75 else None
+    return best_match
+
+
+def opponents_match(norm1: str, norm2: str) -> bool:
+    """Check if two normalized team names are close enough to be the same team."""
+    if norm1 == norm2:
+        return True
+    
+    ratio = fuzz.ratio(norm1, norm2)
+    if ratio >= OPPONENT_RATIO_THRESHOLD:
+        return True
+    return ratio >= OPPONENT_MIN_RATIO and fuzz.partial_ratio(norm1, norm2) >= OPPONENT_PARTIAL_RATIO_THRESHOLD
+
+
+def index_official_games(official_games: List[OfficialGame]) -> Dict[Tuple, List[OfficialGame]]:
+    """Group official games by (date, league, is_home) for O(1) candidate lookup."""
+    index = defaultdict(list)
+    for official in official_games:
+        index[(official.date.date(), official.league, official.is_home)].append(official)
+    return index
 
 
 def update_line_with_time(original_line: str, new_time: str) -> str:
     """Update the time portion of a schedule line."""
     # Pattern: look for existing time before @ or at end
     # Remove existing time if present
-    line = re.sub(r',\s*\d{1,2}:\d{2}\s*(?:AM|PM)?\s*ET', '', original_line, flags=re.IGNORECASE)
+    line = _EXISTING_TIME_RE.sub('', original_line)
     
     # Add new time before @ or at end
     if '@' in line and not line.rstrip().endswith('@'):
@@ -656,230 +850,312 @@ def update_line_with_time(original_line: str, new_time: str) -> str:
     return line
 
 
-def process_schedule_file(file_path: Path, config: Dict, playwright_page: Optional[Page] = None) -> Tuple[int, int]:
-    """Process a single schedule file and update tipoff times."""
-    print(f"\n{'='*60}")
-    print(f"Processing: {file_path.name}")
-    print(f"Team: {config['team_name']}")
-    print(f"{'='*60}")
-    
-    # Read file
-    lines = file_path.read_text(encoding='utf-8').split('\n')
-    
-    updated_count = 0
-    skipped_count = 0
-    current_league = None
-    
-    # Fetch official schedules for all leagues
-    official_games = []
-    
-    for league in config['leagues']:
-        print(f"\nFetching {league} schedule...")
-        
-        if league == 'EuroLeague':
-            # Try Playwright first, then RealGM fallback
-            if playwright_page:
-                games = fetch_euroleague_schedule_playwright(
-                    playwright_page,
-                    config.get('euroleague_slug', ''),
-                    config['timezone'],
-                    config['team_name']
-                )
-            else:
-                games = []
-            
-            # Fallback to RealGM
-            if not games:
-                games = fetch_realgm_schedule(
-                    config.get('realgm_url', ''),
-                    config['timezone'],
-                    config['team_name'],
-                    league
-                )
-        elif league == 'EuroCup':
-            games = fetch_realgm_schedule(
-                config.get('realgm_url', ''),
-                config['timezone'],
-                config['team_name'],
-                league
+async def fetch_league_games(league: str, team_name: str, team_tz: str, realgm_url: str,
+                             euroleague_slug: str, page_pool: Optional[asyncio.Queue]) -> List[OfficialGame]:
+    """Fetch one league's official schedule for a team, falling back to RealGM."""
+    if league == 'EuroLeague':
+        # Try Playwright first, then RealGM fallback
+        if page_pool is not None:
+            games = await fetch_euroleague_schedule_playwright(
+                page_pool,
+                euroleague_slug,
+                team_tz,
+                team_name
             )
-        elif league == 'Liga ACB':
-            games = fetch_acb_schedule_web(config['team_name'], config['timezone'], playwright_page)
-            if not games:
-                # Fallback to RealGM if available
-                games = fetch_realgm_schedule(
-                    config.get('realgm_url', ''),
-                    config['timezone'],
-                    config['team_name'],
-                    league
-                )
-        elif league == 'LNB Pro A':
-            games = fetch_lnb_schedule_web(config['team_name'], config['timezone'], playwright_page)
-            if not games:
-                # Fallback to RealGM if available
-                games = fetch_realgm_schedule(
-                    config.get('realgm_url', ''),
-                    config['timezone'],
-                    config['team_name'],
-                    league
-                )
         else:
             games = []
         
-        official_games.extend(games)
-        
-        # Rate limiting
-        time.sleep(1)
+        # Fallback to RealGM
+        if not games:
+            games = await fetch_realgm_schedule(realgm_url, team_tz, team_name, league)
+    elif league == 'EuroCup':
+        games = await fetch_realgm_schedule(realgm_url, team_tz, team_name, league)
+    elif league == 'Liga ACB':
+        games = await fetch_acb_schedule_web(team_name, team_tz, page_pool)
+        if not games:
+            # Fallback to RealGM if available
+            games = await fetch_realgm_schedule(realgm_url, team_tz, team_name, league)
+    elif league == 'LNB Pro A':
+        games = await fetch_lnb_schedule_web(team_name, team_tz, page_pool)
+        if not games:
+            # Fallback to RealGM if available
+            games = await fetch_realgm_schedule(realgm_url, team_tz, team_name, league)
+    else:
+        games = []
     
-    print(f"\nFound {len(official_games)} official games")
+    return games
+
+
+async def collect_pending(file_path: Path, team: TeamRow, missing_only: bool = False) -> Tuple[List[str], List[Game]]:
+    """Read a schedule file and find the games that need a tipoff time.
     
-    if not official_games:
-        print("  [WARN] No official games fetched. Skipping updates.")
-        return 0, 0
+    Returns the file's lines (with line endings) and the pending games, each
+    carrying its index into those lines as ``line_number``.
+    """
+    team_name = team.team_name
+    league_headers = [(league.upper(), league) for league in team.leagues]
+    current_league = None
+    pending = []
     
-    # Process each line
-    updated_lines = []
-    unmatched_games = []
+    async with aiofiles.open(file_path, 'r', encoding='utf-8') as src:
+        raw_lines = (await src.read()).splitlines(keepends=True)
     
-    for i, line in enumerate(lines):
+    for line_number, raw_line in enumerate(raw_lines):
+        line = raw_line.rstrip('\n')
+        
         # Detect league section headers
-        if any(league.upper() in line.upper() for league in config['leagues']):
-            for league in config['leagues']:
-                if league.upper() in line.upper():
-                    current_league = league
-                    break
+        line_upper = line.upper()
+        for header, league in league_headers:
+            if header in line_upper:
+                current_league = league
+                break
         
         # Skip header lines, empty lines, completed games
-        if (not line.strip() or 
-            config['team_name'] in line and ('Rank:' in line or 'Source:' in line) or
+        if (not current_league or
+            not line.strip() or 
+            team_name in line and ('Rank:' in line or 'Source:' in line) or
             '(W ' in line or 
             '(L ' in line):
-            updated_lines.append(line)
             continue
         
-        # Extract game info
-        if current_league:
-            game = extract_game_info(line, current_league)
+        game = extract_game_info(line, current_league)
+        if game and not (missing_only and game.existing_time):
+            game.line_number = line_number
+            pending.append(game)
+    
+    return raw_lines, pending
+
+
+def apply_official_times(raw_lines: List[str], pending: List[Game], official_games: List[OfficialGame],
+                         team_tz: str) -> Tuple[int, List[Game]]:
+    """Write matched tipoff times into raw_lines in place.
+    
+    Returns the number of updated lines and the games that found no match.
+    """
+    index = index_official_games(official_games)
+    local_tz = _zoneinfo(team_tz)  # resolved once per file, not per game
+    updated_count = 0
+    unmatched_games = []
+    
+    for game in pending:
+        # Try to match with official games on the same date, league and side
+        match = match_game(game, index.get((game.date.date(), game.league, game.is_home), ()))
+        
+        if match:
+            # Convert time to ET
+            et_time = convert_to_et(match.local_time, local_tz)
+            time_str = format_time_et(et_time)
             
-            if game:
-                # Try to match with official games
-                match = match_game(game, official_games)
-                
-                if match:
-                    # Convert time to ET
-                    et_time = convert_to_et(match.local_time, config['timezone'])
-                    time_str = format_time_et(et_time)
-                    
-                    # Update line
-                    updated_line = update_line_with_time(line, time_str)
-                    updated_lines.append(updated_line)
-                    updated_count += 1
-                    
-                    print(f"  ✓ Updated: {game.date.strftime('%b %d')} {'vs' if game.is_home else '@'} {game.opponent} -> {time_str}")
-                else:
-                    updated_lines.append(line)
-                    skipped_count += 1
-                    unmatched_games.append(game)
-                    print(f"  ✗ Skipped: {game.date.strftime('%b %d')} {'vs' if game.is_home else '@'} {game.opponent} (no match found)")
-            else:
-                updated_lines.append(line)
+            # Update line, keeping its original line ending
+            raw_line = raw_lines[game.line_number]
+            line = raw_line.rstrip('\n')
+            raw_lines[game.line_number] = update_line_with_time(line, time_str) + raw_line[len(line):]
+            updated_count += 1
+            
+            log(f"  ✓ Updated: {game.date.strftime('%b %d')} {'vs' if game.is_home else '@'} {game.opponent} -> {time_str}")
         else:
-            updated_lines.append(line)
+            unmatched_games.append(game)
+            log(f"  ✗ Skipped: {game.date.strftime('%b %d')} {'vs' if game.is_home else '@'} {game.opponent} (no match found)")
+    
+    return updated_count, unmatched_games
+
+
+async def process_schedule_file(file_path: Path, team: TeamRow, page_pool: Optional[asyncio.Queue] = None,
+                                missing_only: bool = False) -> Tuple[int, int]:
+    """Process a single schedule file and update tipoff times."""
+    team_name, team_tz, leagues, realgm_url, euroleague_slug = team
+    
+    log(f"\n{'='*60}")
+    log(f"Processing: {file_path.name}")
+    log(f"Team: {team_name}")
+    log(f"{'='*60}")
+    
+    # Find the games to update before touching the network
+    raw_lines, pending = await collect_pending(file_path, team, missing_only)
+    
+    if not pending:
+        log("  [INFO] No games need a tipoff time. Skipping fetch.")
+        return 0, 0
+    
+    # Fetch official schedules only for leagues with pending games
+    pending_leagues = {game.league for game in pending}
+    official_games = []
+    
+    for league in leagues:
+        if league not in pending_leagues:
+            continue
+        log(f"\nFetching {league} schedule...")
+        games = await fetch_league_games(
+            league, team_name, team_tz, realgm_url,
+            euroleague_slug, page_pool
+        )
+        official_games.extend(games)
     
-    # Write updated file
-    file_path.write_text('\n'.join(updated_lines), encoding='utf-8')
+    log(f"\nFound {len(official_games)} official games")
+    
+    if not official_games:
+        log("  [WARN] No official games fetched. Skipping updates.")
+        return 0, 0
+    
+    updated_count, unmatched_games = apply_official_times(raw_lines, pending, official_games, team_tz)
+    
+    # Write the updated lines once to a temp copy that replaces the original;
+    # disk I/O goes through aiofiles so it overlaps other files' page loads.
+    # Files where nothing matched are left untouched.
+    if updated_count:
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        try:
+            async with aiofiles.open(tmp_path, 'w', encoding='utf-8') as f:
+                await f.write(''.join(raw_lines))
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
     
     # Log unmatched games
     if unmatched_games:
         log_path = file_path.parent / f"{file_path.stem}_unmatched.log"
-        with log_path.open('w', encoding='utf-8') as f:
-            f.write(f"Unmatched games for {config['team_name']}\n")
-            f.write("="*60 + "\n\n")
-            for game in unmatched_games:
-                f.write(f"{game.date.strftime('%b %d, %Y')} - {'vs' if game.is_home else '@'} {game.opponent}\n")
+        log_lines = [f"Unmatched games for {team_name}\n", "="*60 + "\n\n"]
+        for game in unmatched_games:
+            log_lines.append(f"{game.date.strftime('%b %d, %Y')} - {'vs' if game.is_home else '@'} {game.opponent}\n")
+        async with aiofiles.open(log_path, 'w', encoding='utf-8') as f:
+            await f.write(''.join(log_lines))
+    
+    return updated_count, len(unmatched_games)
+
+
+async def process_team_file(filename: str, script_dir: Path, page_pool: Optional[asyncio.Queue],
+                            errors: List[Tuple[str, str]], missing_only: bool = False) -> Optional[Tuple[int, int]]:
+    """Process one schedule file, loading pages from the shared pool.
     
-    return updated_count, skipped_count
+    The file must exist and have a TEAM_CONFIG entry (main() checks both).
+    Returns (updated, skipped), or None if processing failed; failures are
+    appended to errors as (filename, traceback) for the report.
+    """
+    try:
+        return await process_schedule_file(script_dir / filename, _TEAM_ROWS[filename], page_pool, missing_only)
+    except Exception as e:
+        log(f"\n[ERROR] Failed to process {filename}: {e}")
+        errors.append((filename, traceback.format_exc()))
+        return None
 
 
-def main():
+async def main():
     """Main function."""
     import argparse
     
     parser = argparse.ArgumentParser(description='Update tipoff times in schedule files')
     parser.add_argument('--dry-run', action='store_true', help='Test without modifying files')
     parser.add_argument('--file', help='Process only a specific file')
+    parser.add_argument('--debug', action='store_true', help='Log full tracebacks for failed fetches')
+    parser.add_argument('--missing-only', action='store_true', help='Only look up games that have no tipoff time yet')
+    parser.add_argument('--no-sandbox', action='store_true', help='Run Chromium without its sandbox (containers/CI only)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Number of files processed at once (default: 4)')
     args = parser.parse_args()
     
-    print("Basketball Schedule Tipoff Time Updater")
-    print("="*60)
+    if args.debug:
+        logging.basicConfig(level=logging.DEBUG)
+    
+    sys.stdout.write("Basketball Schedule Tipoff Time Updater\n" + "="*60 + "\n")
     
     script_dir = Path(__file__).parent
-    schedule_files = [
-        'adam_atamna_schedule.txt',
-        'mouhamed_faye_schedule.txt',
-        'sergio_de_larrea_schedule.txt',
-        'michael_ruzic_schedule.txt',
-    ]
+    schedule_files = [args.file] if args.file else list(TEAM_CONFIG)
     
-    if args.file:
-        schedule_files = [args.file]
+    # One directory listing replaces a stat() per file; missing and
+    # unconfigured files are reported together, in order, and dropped
+    present = {entry.name for entry in os.scandir(script_dir) if entry.is_file()}
+    problems = []
+    runnable = []
+    for filename in schedule_files:
+        if filename not in present:
+            problems.append(f"\n[ERROR] File not found: {filename}")
+        elif filename not in _TEAM_ROWS:
+            problems.append(f"\n[ERROR] No config for: {filename}")
+        else:
+            runnable.append(filename)
+    if problems:
+        sys.stdout.write("\n".join(problems) + "\n")
+    schedule_files = runnable
     
     total_updated = 0
     total_skipped = 0
     
-    # Initialize Playwright if available
-    playwright_page = None
-    playwright_context = None
+    # Files are independent and mostly wait on the network, so process them
+    # concurrently on the event loop, at most --concurrency at a time
+    concurrency = max(1, args.concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    playwright = None
+    browser = None
+    context = None
+    page_pool = None
     
+    # One browser and one context for the whole run, with a pool of warm
+    # tabs (one per concurrent file) that are reused via goto()
     if PLAYWRIGHT_AVAILABLE and not args.dry_run:
         try:
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(headless=True)
-            playwright_context = browser.new_context(
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(headless=True, args=chromium_launch_args(args.no_sandbox))
+            context = await browser.new_context(
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             )
-            playwright_page = playwright_context.new_page()
+            page_pool = asyncio.Queue()
+            for _ in range(concurrency):
+                page_pool.put_nowait(await context.new_page())
         except Exception as e:
             print(f"[WARN] Could not initialize Playwright: {e}")
-            playwright_page = None
+            page_pool = None
     
-    try:
-        for filename in schedule_files:
-            file_path = script_dir / filename
-            
-            if not file_path.exists():
-                print(f"\n[ERROR] File not found: {filename}")
-                continue
-            
-            config = TEAM_CONFIG.get(filename)
-            if not config:
-                print(f"\n[ERROR] No config for: {filename}")
-                continue
-            
+    errors: List[Tuple[str, str]] = []
+    
+    async def bounded(filename: str) -> Optional[Tuple[int, int]]:
+        async with semaphore:
+            # Runs in its own gather task, so the buffer is private to this file
+            lines: List[str] = []
+            _FILE_LOG.set(lines)
             try:
-                updated, skipped = process_schedule_file(file_path, config, playwright_page)
-                total_updated += updated
-                total_skipped += skipped
-                
-                print(f"\nSummary for {filename}:")
-                print(f"  Updated: {updated}")
-                print(f"  Skipped: {skipped}")
-                
-            except Exception as e:
-                print(f"\n[ERROR] Failed to process {filename}: {e}")
-                import traceback
-                traceback.print_exc()
+                return await process_team_file(filename, script_dir, page_pool, errors, args.missing_only)
+            finally:
+                sys.stdout.write("\n".join(lines) + "\n")
+    
+    try:
+        results = await asyncio.gather(*(bounded(filename) for filename in schedule_files))
     finally:
-        if playwright_context:
-            playwright_context.close()
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if playwright:
+            await playwright.stop()
     
-    print(f"\n{'='*60}")
-    print("FINAL SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total games updated: {total_updated}")
-    print(f"Total games skipped: {total_skipped}")
-    print(f"{'='*60}\n")
-
+    # Tracebacks for failed files, then the per-file and final summaries,
+    # built in file order and emitted with a single write
+    out = [f"\n[ERROR] {filename}:\n{tb}" for filename, tb in errors]
+    
+    for filename, result in zip(schedule_files, results):
+        if result is None:
+            continue
+        
+        updated, skipped = result
+        total_updated += updated
+        total_skipped += skipped
+        
+        out.append(f"\nSummary for {filename}:\n  Updated: {updated}\n  Skipped: {skipped}")
+    
+    out.append(
+        f"\n{'='*60}\n"
+        "FINAL SUMMARY\n"
+        f"{'='*60}\n"
+        f"Total games updated: {total_updated}\n"
+        f"Total games skipped: {total_skipped}\n"
+        f"{'='*60}\n"
+    )
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 if __name__ == '__main__':
-    main()
+    try:
+        # Faster event loop on Linux/macOS: pip install uvloop
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())